@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 import contextlib
+import hmac
+import math
 
 from starlette.applications import Starlette
 from starlette.responses import JSONResponse, PlainTextResponse
@@ -9,6 +11,8 @@ from starlette.middleware.cors import CORSMiddleware
 
 from mcp.server.fastmcp import FastMCP
 
+from typhoon_mcp import profiling
+from typhoon_mcp.config import ADMIN_TOKEN
 from typhoon_mcp.kma_client import KmaTyphoonClient
 from typhoon_mcp.logic import build_response
 from typhoon_mcp.prompts import SYSTEM_PROMPT
@@ -53,7 +57,8 @@ def typhoon_action_guide_system_prompt() -> str:
 
 @mcp.tool()
 async def typhoon_action_guide(user_message: str) -> str:
-    return await build_response(user_message, client)
+    with profiling.trace("typhoon_action_guide"):
+        return await build_response(user_message, client)
 
 
 async def health(request):
@@ -64,6 +69,55 @@ async def root(request):
     return PlainTextResponse("Typhoon Action Guide MCP is running. MCP endpoint is /mcp")
 
 
+# =========================================================
+# ✅ 관리자 전용: 샘플링 프로파일러 / 요청 트레이스
+# - ADMIN_TOKEN 미설정 시 404 (엔드포인트 자체를 숨김)
+# - 인증: "Authorization: Bearer <토큰>" 또는 "X-Admin-Token: <토큰>"
+# =========================================================
+def _admin_denied(request) -> JSONResponse | None:
+    if not ADMIN_TOKEN:
+        return JSONResponse({"error": "not found"}, status_code=404)
+    auth = request.headers.get("authorization", "")
+    token = auth[7:] if auth.lower().startswith("bearer ") else request.headers.get("x-admin-token", "")
+    if not hmac.compare_digest(token.encode(), ADMIN_TOKEN.encode()):
+        return JSONResponse({"error": "unauthorized"}, status_code=401)
+    return None
+
+
+async def admin_profile(request):
+    # GET /admin/profile?seconds=10&interval_ms=5 → collapsed stack 텍스트 (flamegraph.pl / speedscope 호환)
+    denied = _admin_denied(request)
+    if denied:
+        return denied
+    try:
+        seconds = float(request.query_params.get("seconds", "10"))
+        interval_ms = request.query_params.get("interval_ms")
+        interval_ms = float(interval_ms) if interval_ms else None
+    except ValueError:
+        return JSONResponse({"error": "seconds/interval_ms must be numbers"}, status_code=400)
+    if not (math.isfinite(seconds) and seconds > 0) or (
+        interval_ms is not None and not (math.isfinite(interval_ms) and interval_ms > 0)
+    ):
+        return JSONResponse({"error": "seconds/interval_ms must be finite positive numbers"}, status_code=400)
+    try:
+        collapsed, samples = await profiling.profile(seconds, interval_ms)
+    except RuntimeError as e:
+        return JSONResponse({"error": str(e)}, status_code=409)
+    return PlainTextResponse(collapsed + "\n", headers={"X-Profile-Samples": str(samples)})
+
+
+async def admin_traces(request):
+    # GET /admin/traces?limit=50 → 최근 샘플링된 typhoon_action_guide 호출의 span 목록
+    denied = _admin_denied(request)
+    if denied:
+        return denied
+    try:
+        limit = int(request.query_params.get("limit", "50"))
+    except ValueError:
+        return JSONResponse({"error": "limit must be an integer"}, status_code=400)
+    return JSONResponse({"traces": profiling.recent_traces(limit)})
+
+
 @contextlib.asynccontextmanager
 async def lifespan(app: Starlette):
     async with mcp.session_manager.run():
@@ -75,6 +129,8 @@ starlette_app = Starlette(
     routes=[
         Route("/", root, methods=["GET"]),
         Route("/health", health, methods=["GET"]),
+        Route("/admin/profile", admin_profile, methods=["GET"]),
+        Route("/admin/traces", admin_traces, methods=["GET"]),
         Mount("/", app=mcp.streamable_http_app()),
     ],
     lifespan=lifespan,
@@ -0,0 +1,41 @@
+import pytest
+from starlette.testclient import TestClient
+
+import app as app_module
+
+@pytest.fixture
+def client(monkeypatch):
+    monkeypatch.setattr(app_module, "ADMIN_TOKEN", "secret")
+    return TestClient(app_module.starlette_app)
+
+def test_admin_disabled_without_token(monkeypatch):
+    monkeypatch.setattr(app_module, "ADMIN_TOKEN", None)
+    c = TestClient(app_module.starlette_app)
+    assert c.get("/admin/profile", headers={"X-Admin-Token": "x"}).status_code == 404
+    assert c.get("/admin/traces", headers={"X-Admin-Token": "x"}).status_code == 404
+
+@pytest.mark.parametrize("path", ["/admin/profile?seconds=0.05", "/admin/traces"])
+def test_admin_rejects_bad_token(client, path):
+    assert client.get(path).status_code == 401
+    assert client.get(path, headers={"Authorization": "Bearer wrong"}).status_code == 401
+    assert client.get(path, headers={"X-Admin-Token": "wrong"}).status_code == 401
+
+@pytest.mark.parametrize("headers", [{"Authorization": "Bearer secret"}, {"X-Admin-Token": "secret"}])
+def test_admin_accepts_token(client, headers):
+    r = client.get("/admin/profile?seconds=0.05&interval_ms=1", headers=headers)
+    assert r.status_code == 200
+    assert int(r.headers["X-Profile-Samples"]) > 0
+    r = client.get("/admin/traces", headers=headers)
+    assert r.status_code == 200
+    assert "traces" in r.json()
+
+@pytest.mark.parametrize("query", [
+    "seconds=abc", "seconds=nan", "seconds=inf", "seconds=-1", "seconds=0",
+    "seconds=0.05&interval_ms=nan", "seconds=0.05&interval_ms=inf", "seconds=0.05&interval_ms=x",
+])
+def test_admin_profile_rejects_bad_params(client, query):
+    assert client.get(f"/admin/profile?{query}", headers={"X-Admin-Token": "secret"}).status_code == 400
+
+@pytest.mark.parametrize("limit", ["abc", "nan", "inf", "1.5"])
+def test_admin_traces_rejects_bad_limit(client, limit):
+    assert client.get(f"/admin/traces?limit={limit}", headers={"X-Admin-Token": "secret"}).status_code == 400
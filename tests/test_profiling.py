@@ -0,0 +1,90 @@
+import asyncio
+import datetime as dt
+import time
+
+import pytest
+
+from typhoon_mcp import kma_client, profiling
+from typhoon_mcp.formatter import KST
+from typhoon_mcp.logic import build_response
+
+def test_trace_disabled_is_noop():
+    profiling.clear_traces()
+    with profiling.trace("t", sample_rate=0):
+        with profiling.span("render"):
+            pass
+    assert profiling.recent_traces() == []
+
+def test_trace_records_spans():
+    profiling.clear_traces()
+    with profiling.trace("t", sample_rate=1):
+        with profiling.span("upstream_fetch"):
+            with profiling.span("parse"):
+                pass
+        with profiling.span("render"):
+            pass
+    (tr,) = profiling.recent_traces()
+    assert tr["name"] == "t"
+    assert [(s["name"], s["depth"]) for s in tr["spans"]] == [("upstream_fetch", 0), ("parse", 1), ("render", 0)]
+    assert all(s["duration_ms"] >= 0 for s in tr["spans"])
+
+def test_profile_collapsed_output():
+    async def run():
+        task = asyncio.create_task(profiling.profile(0.2, 1))
+        end = time.perf_counter() + 0.1
+        while time.perf_counter() < end:
+            await asyncio.sleep(0)
+        return await task
+    collapsed, samples = asyncio.run(run())
+    assert samples > 0
+    line = collapsed.splitlines()[0]
+    stack, count = line.rsplit(" ", 1)
+    assert int(count) > 0 and ";" in stack
+
+def test_profile_rejects_non_finite():
+    for seconds, interval_ms in [(float("nan"), None), (float("inf"), None), (0, None), (0.1, float("nan")), (0.1, float("inf"))]:
+        with pytest.raises(ValueError):
+            asyncio.run(profiling.profile(seconds, interval_ms))
+
+class _FakeResponse:
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        now = dt.datetime.now(KST)
+        tmfc = now.strftime("%Y%m%d%H%M")
+        items = [
+            {"tmFc": tmfc, "tmSeq": "1", "typTm": (now + dt.timedelta(hours=h)).strftime("%Y%m%d%H%M"),
+             "typLat": lat, "typLon": lon, "typName": "테스트"}
+            for h, lat, lon in [(0, 30.0, 127.0), (6, 33.0, 128.0), (12, 35.0, 129.0)]
+        ]
+        return {"response": {"body": {"items": {"item": items}}}}
+
+class _FakeAsyncClient:
+    def __init__(self, *args, **kwargs):
+        pass
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def get(self, url, params=None):
+        return _FakeResponse()
+
+def test_build_response_spans(monkeypatch):
+    monkeypatch.setattr(kma_client, "KMA_TYPHOON_SERVICE_KEY", "test-key")
+    monkeypatch.setattr(kma_client.httpx, "AsyncClient", _FakeAsyncClient)
+    profiling.clear_traces()
+
+    async def run():
+        with profiling.trace("typhoon_action_guide", sample_rate=1):
+            return await build_response("부산", kma_client.KmaTyphoonClient())
+
+    text = asyncio.run(run())
+    assert "[한 줄 요약]" in text
+    (tr,) = profiling.recent_traces()
+    assert [s["name"] for s in tr["spans"]] == [
+        "region_resolution", "cache_lookup", "upstream_fetch", "parse", "summarize_track", "render",
+    ]
@@ -18,3 +18,16 @@ HTTP_TIMEOUT = float(get_env("HTTP_TIMEOUT", "10") or "10")
 
 # 캐시 TTL(초)
 CACHE_TTL_SECONDS = int(get_env("CACHE_TTL_SECONDS", "600") or "600")
+
+# 관리자 전용 엔드포인트(/admin/*) 토큰. 비어 있으면 관리자 엔드포인트는 비활성(404)
+ADMIN_TOKEN = get_env("ADMIN_TOKEN")
+
+# typhoon_action_guide 호출 중 span 트레이스를 남길 비율(0.0~1.0). 0이면 트레이스 비활성
+TRACE_SAMPLE_RATE = float(get_env("TRACE_SAMPLE_RATE", "0") or "0")
+
+# 최근 트레이스 보관 개수
+TRACE_BUFFER_SIZE = int(get_env("TRACE_BUFFER_SIZE", "200") or "200")
+
+# 샘플링 프로파일러 최대 실행 시간(초)과 샘플 간격(밀리초)
+PROFILE_MAX_SECONDS = float(get_env("PROFILE_MAX_SECONDS", "30") or "30")
+PROFILE_INTERVAL_MS = float(get_env("PROFILE_INTERVAL_MS", "5") or "5")
@@ -7,6 +7,7 @@ from typing import Any, Optional
 import httpx
 
 from .config import KMA_TYPHOON_SERVICE_KEY, HTTP_TIMEOUT, CACHE_TTL_SECONDS
+from .profiling import span
 
 BASE_URL = "https://apis.data.go.kr/1360000/TyphoonInfoService/getTyphoonInfo"
 
@@ -49,13 +50,14 @@ class KmaTyphoonClient:
         end = now.strftime("%Y%m%d")
 
         cache_key = f"{start}:{end}"
-        async with self._lock:
-            cached = self._cache.get(cache_key)
-            if cached and (now.timestamp() - cached[0]) < CACHE_TTL_SECONDS:
-                pts = cached[1]
-                tmfc = max((p.tmFc for p in pts), default=None)
-                name = _pick_name(pts)
-                return tmfc, _filter_latest_bulletin(pts, tmfc), name
+        with span("cache_lookup"):
+            async with self._lock:
+                cached = self._cache.get(cache_key)
+        if cached and (now.timestamp() - cached[0]) < CACHE_TTL_SECONDS:
+            pts = cached[1]
+            tmfc = max((p.tmFc for p in pts), default=None)
+            name = _pick_name(pts)
+            return tmfc, _filter_latest_bulletin(pts, tmfc), name
 
         params = {
             "serviceKey": KMA_TYPHOON_SERVICE_KEY,  # data.go.kr는 serviceKey/ServiceKey 둘 다 수용되는 경우가 많음
@@ -66,12 +68,14 @@ class KmaTyphoonClient:
             "toTmFc": end,
         }
 
-        async with httpx.AsyncClient(timeout=HTTP_TIMEOUT) as client:
-            r = await client.get(BASE_URL, params=params)
-            r.raise_for_status()
-            data = r.json()
+        with span("upstream_fetch"):
+            async with httpx.AsyncClient(timeout=HTTP_TIMEOUT) as client:
+                r = await client.get(BASE_URL, params=params)
+                r.raise_for_status()
 
-        pts = _parse_points(data)
+        with span("parse"):
+            data = r.json()
+            pts = _parse_points(data)
         async with self._lock:
             self._cache[cache_key] = (now.timestamp(), pts)
 
@@ -6,6 +6,7 @@ from typing import Optional, Tuple
 from .kma_client import KmaTyphoonClient, TyphoonPoint
 from .region import find_region, infer_environment, infer_intent, Region
 from .formatter import parse_kst_yyyymmddhhmm, fmt_kst_baseline, fmt_risk_window, KST
+from .profiling import span
 
 def haversine_km(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
     # 지구 반지름(km)
@@ -157,9 +158,10 @@ async def build_response(user_text: str, client: KmaTyphoonClient) -> str:
         user_text = "산간·하천"
     # --- [추가 끝] ---
 
-    region = find_region(user_text)
-    env = infer_environment(user_text) or ("해안·섬" if (region and region.name in ["제주", "제주시", "서귀포", "부산", "여수", "목포", "남해안", "동해안", "서해안"]) else None)
-    intent = infer_intent(user_text)
+    with span("region_resolution"):
+        region = find_region(user_text)
+        env = infer_environment(user_text) or ("해안·섬" if (region and region.name in ["제주", "제주시", "서귀포", "부산", "여수", "목포", "남해안", "동해안", "서해안"]) else None)
+        intent = infer_intent(user_text)
 
     # 정보가 거의 없으면 질문 유도(2단계 중 1단계만 제시)
     if (region is None) and (env is None) and (intent == "일반"):
@@ -211,7 +213,8 @@ async def build_response(user_text: str, client: KmaTyphoonClient) -> str:
 
     base = fmt_kst_baseline(tmFc)
 
-    track, risk_text, risk_window = summarize_track(points, region, now)
+    with span("summarize_track"):
+        track, risk_text, risk_window = summarize_track(points, region, now)
 
     if env is None:
         env = "내륙" if region else "일반"
@@ -235,12 +238,13 @@ async def build_response(user_text: str, client: KmaTyphoonClient) -> str:
     return _render(base, track + (f"\n\n가장 영향이 큰 시간: {risk_text}" if risk_text else ""), must, forbid, one_line)
 
 def _render(base: str, track: str, must: list[str], forbid: list[str], one_line: str) -> str:
-    must_lines = "\n".join([f"- {x}" for x in must])
-    forbid_lines = "\n".join([f"- {x}" for x in forbid])
-    return (
-        f"[기준 정보]\n{base}\n\n"
-        f"[태풍 이동 및 시간 요약]\n{track}\n\n"
-        f"[지금 반드시 해야 할 행동]\n{must_lines}\n\n"
-        f"[하면 안 되는 행동]\n{forbid_lines}\n\n"
-        f"[한 줄 요약]\n{one_line}"
-    )
+    with span("render"):
+        must_lines = "\n".join([f"- {x}" for x in must])
+        forbid_lines = "\n".join([f"- {x}" for x in forbid])
+        return (
+            f"[기준 정보]\n{base}\n\n"
+            f"[태풍 이동 및 시간 요약]\n{track}\n\n"
+            f"[지금 반드시 해야 할 행동]\n{must_lines}\n\n"
+            f"[하면 안 되는 행동]\n{forbid_lines}\n\n"
+            f"[한 줄 요약]\n{one_line}"
+        )
@@ -0,0 +1,160 @@
+from __future__ import annotations
+import asyncio
+import contextlib
+import contextvars
+import math
+import os
+import random
+import sys
+import threading
+import time
+from collections import Counter, deque
+from dataclasses import dataclass, field
+from typing import Any, Iterator, Optional
+
+from .config import TRACE_SAMPLE_RATE, TRACE_BUFFER_SIZE, PROFILE_MAX_SECONDS, PROFILE_INTERVAL_MS
+
+# =========================================================
+# 요청 단위 span 트레이스
+# - 샘플링되지 않은 요청은 contextvar 조회 1회 + 재사용 nullcontext만 사용 (비용 거의 없음)
+# =========================================================
+
+@dataclass
+class Trace:
+    name: str
+    started_at: float                 # epoch 초
+    t0: float                         # perf_counter 기준점
+    spans: list[dict[str, Any]] = field(default_factory=list)
+    depth: int = 0
+    duration_ms: float | None = None
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "name": self.name,
+            "started_at": self.started_at,
+            "duration_ms": self.duration_ms,
+            "spans": list(self.spans),
+        }
+
+_current: contextvars.ContextVar[Optional[Trace]] = contextvars.ContextVar("typhoon_trace", default=None)
+_traces: deque[Trace] = deque(maxlen=max(TRACE_BUFFER_SIZE, 1))
+_NOOP = contextlib.nullcontext()
+
+@contextlib.contextmanager
+def _run_trace(name: str) -> Iterator[Trace]:
+    tr = Trace(name=name, started_at=time.time(), t0=time.perf_counter())
+    token = _current.set(tr)
+    try:
+        yield tr
+    finally:
+        tr.duration_ms = round((time.perf_counter() - tr.t0) * 1000, 3)
+        _current.reset(token)
+        _traces.append(tr)
+
+def trace(name: str, sample_rate: float | None = None) -> contextlib.AbstractContextManager[Any]:
+    """sample_rate(기본: TRACE_SAMPLE_RATE) 비율로만 트레이스를 기록합니다."""
+    rate = TRACE_SAMPLE_RATE if sample_rate is None else sample_rate
+    if rate <= 0 or (rate < 1 and random.random() >= rate):
+        return _NOOP
+    return _run_trace(name)
+
+@contextlib.contextmanager
+def _run_span(tr: Trace, name: str) -> Iterator[None]:
+    start = time.perf_counter()
+    rec: dict[str, Any] = {"name": name, "depth": tr.depth, "start_ms": round((start - tr.t0) * 1000, 3)}
+    tr.spans.append(rec)
+    tr.depth += 1
+    try:
+        yield
+    finally:
+        tr.depth -= 1
+        rec["duration_ms"] = round((time.perf_counter() - start) * 1000, 3)
+
+def span(name: str) -> contextlib.AbstractContextManager[Any]:
+    tr = _current.get()
+    if tr is None:
+        return _NOOP
+    return _run_span(tr, name)
+
+def recent_traces(limit: int | None = None) -> list[dict[str, Any]]:
+    items = list(_traces)
+    if limit is not None:
+        items = items[-limit:] if limit > 0 else []
+    return [t.to_dict() for t in items]
+
+def clear_traces() -> None:
+    _traces.clear()
+
+# =========================================================
+# 온디맨드 샘플링 프로파일러
+# - 별도 스레드가 interval마다 sys._current_frames()로 모든 스레드 스택을 수집
+# - 결과는 collapsed stack 형식("a;b;c 횟수") → flamegraph.pl / speedscope에서 바로 사용 가능
+# - 요청 시에만 스레드가 뜨므로, 꺼져 있을 때 비용 없음
+# =========================================================
+
+class StackSampler:
+    def __init__(self, interval: float) -> None:
+        self.interval = interval
+        self.counts: Counter[str] = Counter()
+        self.samples = 0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="stack-sampler", daemon=True)
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        self._thread.join()
+
+    def _run(self) -> None:
+        own = threading.get_ident()
+        while not self._stop.wait(self.interval):
+            names = {t.ident: t.name for t in threading.enumerate()}
+            for tid, frame in sys._current_frames().items():
+                if tid == own:
+                    continue
+                self.counts[_collapse(frame, names.get(tid, str(tid)))] += 1
+            self.samples += 1
+
+    def collapsed(self) -> str:
+        return "\n".join(f"{stack} {n}" for stack, n in self.counts.most_common())
+
+def _collapse(frame: Any, thread_name: str) -> str:
+    parts: list[str] = []
+    f = frame
+    while f is not None:
+        code = f.f_code
+        parts.append(f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})")
+        f = f.f_back
+    parts.append(thread_name)
+    parts.reverse()
+    # collapsed 형식에서 ';'와 공백 뒤 숫자는 구분자이므로 프레임 이름에 ';'가 들어가지 않게 치환
+    return ";".join(p.replace(";", ":") for p in parts)
+
+_profile_lock = asyncio.Lock()
+
+async def profile(seconds: float, interval_ms: float | None = None) -> tuple[str, int]:
+    """
+    seconds 동안(최대 PROFILE_MAX_SECONDS) 샘플링 후 (collapsed stack 텍스트, 샘플 수)를 반환합니다.
+    seconds/interval_ms가 유한한 양수가 아니면 ValueError, 이미 실행 중이면 RuntimeError.
+    """
+    if interval_ms is None:
+        interval_ms = PROFILE_INTERVAL_MS
+    # NaN/inf는 min()/max()를 그대로 통과해 sleep·wait가 끝나지 않거나 스레드가 죽으므로 먼저 거른다
+    if not (math.isfinite(seconds) and seconds > 0):
+        raise ValueError("seconds는 0보다 큰 유한한 수여야 합니다.")
+    if not (math.isfinite(interval_ms) and interval_ms > 0):
+        raise ValueError("interval_ms는 0보다 큰 유한한 수여야 합니다.")
+    if _profile_lock.locked():
+        raise RuntimeError("프로파일러가 이미 실행 중입니다.")
+    seconds = min(seconds, PROFILE_MAX_SECONDS)
+    interval = min(max(interval_ms, 1.0) / 1000, seconds)
+    async with _profile_lock:
+        sampler = StackSampler(interval)
+        sampler.start()
+        try:
+            await asyncio.sleep(seconds)
+        finally:
+            sampler.stop()
+        return sampler.collapsed(), sampler.samples